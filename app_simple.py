@@ -1,12 +1,11 @@
 import streamlit as st
-import pandas as pd
-import plotly.graph_objects as go
-from datetime import datetime
 import os
-import io
 import hashlib
-import re
-import time
+import heapq
+
+from utils.document_formats import extract_docx_text, release_mupdf_store
+from utils.spacy_support import SPACY_EXCLUDED_COMPONENTS, start_model_preload
+from utils.text_analysis import extract_keywords_regex
 
 # Lazy imports for better performance
 @st.cache_resource
@@ -15,8 +14,7 @@ def load_dependencies():
     try:
         import fitz  # PyMuPDF for PDF processing
         import spacy  # Natural language processing
-        import docx  # Python-docx for DOCX files
-        return fitz, spacy, docx
+        return fitz, spacy
     except ImportError as e:
         missing_lib = str(e).split("'")[1] if "'" in str(e) else "unknown"
         st.error(f"""
@@ -32,26 +30,33 @@ def load_dependencies():
         pip install -r requirements.txt
         ```
         """)
-        return None, None, None
+        return None, None
 
-# Optimized spaCy model loading with better caching
-@st.cache_resource
-def load_spacy_model():
-    """Load spaCy model with optimized settings for speed"""
+# Optimized spaCy model loading with better caching. The cached loader makes
+# no UI calls so the preload thread can run it; errors are shown by
+# load_spacy_model in the script thread.
+@st.cache_resource(show_spinner=False)
+def load_spacy_pipeline():
+    """Load the tokenizer-only spaCy pipeline, returning (nlp, error)"""
     try:
-        _, spacy, _ = load_dependencies()
-        if spacy is None:
-            return None
+        import spacy  # Natural language processing
         
-        # Load model with only essential components for speed
-        nlp = spacy.load("en_core_web_sm", disable=["parser", "ner"])
-        return nlp
-    except OSError:
-        st.error("⚠️ spaCy model not found. Please install it by running: python -m spacy download en_core_web_sm")
-        return None
+        # Keywords are matched on lowercase forms, so only the tokenizer is needed;
+        # excluded components are never deserialized
+        return spacy.load("en_core_web_sm", exclude=SPACY_EXCLUDED_COMPONENTS), None
     except Exception as e:
-        st.error(f"Error loading spaCy model: {e}")
-        return None
+        return None, e
+
+def load_spacy_model():
+    """Load spaCy model with optimized settings for speed"""
+    nlp, error = load_spacy_pipeline()
+    if isinstance(error, ImportError):
+        load_dependencies()  # Shows the install instructions
+    elif isinstance(error, OSError):
+        st.error("⚠️ spaCy model not found. Please install it by running: python -m spacy download en_core_web_sm")
+    elif error is not None:
+        st.error(f"Error loading spaCy model: {error}")
+    return nlp
 
 # Page configuration
 st.set_page_config(
@@ -61,6 +66,11 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Every analysis here uses spaCy, so load it while the user picks files;
+# PRELOAD_SPACY=0 disables this
+if os.environ.get("PRELOAD_SPACY", "1") == "1":
+    start_model_preload(load_spacy_pipeline)
+
 # Initialize session state
 if 'processed_resume' not in st.session_state:
     st.session_state.processed_resume = None
@@ -100,74 +110,73 @@ with st.sidebar:
 st.markdown('<div class="main-header"><h1>🧾 AI Resume Grader</h1><p>Get AI-powered analysis of your resume against job requirements</p></div>', unsafe_allow_html=True)
 
 # Create columns
-col1, col2 = st.columns([1, 1], gap="large")
+col1, col2 = st.columns(2, gap="large")
 
 # Helper functions
-def get_text_hash(text):
-    """Generate hash for text to check if it changed"""
-    return hashlib.md5(text.encode()).hexdigest()
+def get_text_hash(data):
+    """Generate hash for text or file bytes to check if it changed"""
+    if isinstance(data, str):
+        data = data.encode()
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
 
 @st.cache_data
-def extract_text_from_pdf(file_bytes, file_name):
+def extract_text_from_pdf(file_hash, _file_bytes):
     """Extract text from PDF file with caching"""
-    fitz, _, _ = load_dependencies()
+    fitz, _ = load_dependencies()
     if fitz is None:
-        return ""
+        raise ImportError("PyMuPDF is not installed")
     
-    text = ""
     try:
-        with fitz.open(stream=file_bytes, filetype="pdf") as doc:
-            for page in doc:
-                text += page.get_text()
-    except Exception as e:
-        st.error(f"Failed to read PDF: {e}")
-    return text
+        with fitz.open(stream=_file_bytes, filetype="pdf") as doc:
+            return "".join(page.get_text("text", sort=False) for page in doc)
+    finally:
+        release_mupdf_store(fitz)
 
 @st.cache_data
-def extract_text_from_docx(file_bytes, file_name):
+def extract_text_from_docx(file_hash, _file_bytes):
     """Extract text from DOCX file with caching"""
-    _, _, docx = load_dependencies()
-    if docx is None:
-        return ""
-    
-    text = ""
-    try:
-        doc = docx.Document(io.BytesIO(file_bytes))
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
-    except Exception as e:
-        st.error(f"Failed to read DOCX: {e}")
-    return text
+    return extract_docx_text(_file_bytes)
 
 @st.cache_data
-def extract_keywords_cached(text, min_length=3):
-    """Extract keywords with caching for better performance"""
-    nlp = load_spacy_model()
-    if nlp is None:
-        # Fallback to simple word extraction if spaCy fails
-        words = re.findall(r'\b[a-zA-Z]{3,}\b', text.lower())
-        stopwords = {'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'can', 'had', 'her', 'was', 'one', 'our', 'out', 'day', 'get', 'has', 'him', 'his', 'how', 'man', 'new', 'now', 'old', 'see', 'two', 'who', 'boy', 'did', 'its', 'let', 'put', 'say', 'she', 'too', 'use'}
-        return set(word for word in words if len(word) >= min_length and word not in stopwords)
-    
-    doc = nlp(text.lower())
+def extract_text_from_txt(file_hash, _file_bytes):
+    """Decode a TXT file with caching"""
+    return _file_bytes.decode("utf-8", errors="ignore")
+
+def keywords_from_doc(doc, min_length=3):
+    """Collect lowercase keywords from a processed spaCy Doc"""
     keywords = set()
     for token in doc:
         if (not token.is_stop 
             and not token.is_punct 
             and not token.like_num 
-            and len(token.lemma_) >= min_length
+            and len(token.lower_) >= min_length
             and token.is_alpha
             and not token.is_space):
-            keywords.add(token.lemma_.lower())
-    return keywords
+            keywords.add(token.lower_)
+    return frozenset(keywords)
 
-def create_score_visualization(score):
-    """Create a gauge chart for the score"""
+@st.cache_data
+def extract_keywords_pair_cached(resume_text, jd_text, min_length=3):
+    """Extract resume and job description keywords in one batched spaCy pass"""
+    nlp = load_spacy_model()
+    if nlp is None:
+        # Fallback to simple word extraction if spaCy fails
+        return (extract_keywords_regex(resume_text, min_length),
+                extract_keywords_regex(jd_text, min_length))
+    
+    resume_doc, jd_doc = nlp.pipe([resume_text.lower(), jd_text.lower()], batch_size=2, n_process=1)
+    return keywords_from_doc(resume_doc, min_length), keywords_from_doc(jd_doc, min_length)
+
+@st.cache_resource
+def load_score_gauge_template():
+    """Build the gauge chart once; only the score changes between renders"""
+    import plotly.graph_objects as go  # Deferred until a score is shown
+    
     fig = go.Figure()
     
     fig.add_trace(go.Indicator(
         mode = "gauge+number",
-        value = score,
+        value = 0,
         title = {'text': "Match Score %"},
         domain = {'x': [0, 1], 'y': [0, 1]},
         gauge = {
@@ -185,6 +194,13 @@ def create_score_visualization(score):
     fig.update_layout(height=250, margin=dict(l=20, r=20, t=40, b=20))
     return fig
 
+def create_score_visualization(score):
+    """Create a gauge chart for the score"""
+    import plotly.graph_objects as go
+    
+    # The template is shared across sessions, so set the score on a copy
+    return go.Figure(load_score_gauge_template()).update_traces(value=score)
+
 # Resume Upload Section
 with col1:
     st.markdown('<div class="upload-section"><h3>📄 Upload Resume</h3><p>Supported: PDF, DOCX, TXT (Max 10MB)</p></div>', unsafe_allow_html=True)
@@ -202,14 +218,24 @@ with col1:
             st.success(f"✅ File uploaded: {uploaded_resume.name}")
             
             # Process file
-            file_bytes = uploaded_resume.read()
+            file_bytes = uploaded_resume.getvalue()
+            # An upload keeps its file_id across reruns, so each file is hashed once
+            if st.session_state.get("resume_file_id") != uploaded_resume.file_id:
+                st.session_state.resume_file_hash = get_text_hash(file_bytes)
+                st.session_state.resume_file_id = uploaded_resume.file_id
+            file_hash = st.session_state.resume_file_hash
             
-            if uploaded_resume.type == "application/pdf":
-                resume_text = extract_text_from_pdf(file_bytes, uploaded_resume.name)
-            elif uploaded_resume.type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-                resume_text = extract_text_from_docx(file_bytes, uploaded_resume.name)
-            else:
-                resume_text = file_bytes.decode("utf-8", errors="ignore")
+            # The extractors raise on failure so a bad read is never cached
+            try:
+                if uploaded_resume.type == "application/pdf":
+                    resume_text = extract_text_from_pdf(file_hash, file_bytes)
+                elif uploaded_resume.type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
+                    resume_text = extract_text_from_docx(file_hash, file_bytes)
+                else:
+                    resume_text = extract_text_from_txt(file_hash, file_bytes)
+            except Exception as e:
+                st.error(f"Failed to read {uploaded_resume.name}: {e}")
+                resume_text = ""
             
             st.session_state.processed_resume = resume_text
             
@@ -244,8 +270,7 @@ if st.session_state.processed_resume and st.session_state.processed_jd:
     if resume_text.strip():
         with st.spinner("🔬 Analyzing skill match..."):
             # Extract keywords
-            resume_keywords = extract_keywords_cached(resume_text, 3)
-            jd_keywords = extract_keywords_cached(job_desc_text, 3)
+            resume_keywords, jd_keywords = extract_keywords_pair_cached(resume_text, job_desc_text, 3)
             
             # Calculate matches
             matched_keywords = resume_keywords.intersection(jd_keywords)
@@ -253,7 +278,7 @@ if st.session_state.processed_resume and st.session_state.processed_jd:
             match_score = round(len(matched_keywords) / len(jd_keywords) * 100, 2) if jd_keywords else 0.0
         
         # Results Layout
-        result_col1, result_col2 = st.columns([1, 1])
+        result_col1, result_col2 = st.columns(2)
         
         with result_col1:
             st.markdown("### 🎯 Match Score")
@@ -279,27 +304,27 @@ if st.session_state.processed_resume and st.session_state.processed_jd:
         
         # Detailed Analysis
         st.markdown("---")
-        analysis_col1, analysis_col2 = st.columns([1, 1])
+        analysis_col1, analysis_col2 = st.columns(2)
         
         with analysis_col1:
             if matched_keywords:
                 st.markdown("### ✅ Matched Skills")
-                matched_list = sorted(list(matched_keywords))
-                for keyword in matched_list[:20]:  # Show first 20
-                    st.markdown(f"• {keyword}")
+                # Show first 20 as one markdown block instead of one element each
+                matched_list = heapq.nsmallest(20, matched_keywords)
+                st.markdown("  \n".join(f"• {keyword}" for keyword in matched_list))
                 
-                if len(matched_list) > 20:
-                    st.info(f"... and {len(matched_list) - 20} more")
+                if len(matched_keywords) > 20:
+                    st.info(f"... and {len(matched_keywords) - 20} more")
         
         with analysis_col2:
             if missing_keywords:
                 st.markdown("### ⚠️ Missing Skills")
-                missing_list = sorted(list(missing_keywords))
-                for keyword in missing_list[:20]:  # Show first 20
-                    st.markdown(f"• {keyword}")
+                # Show first 20 as one markdown block instead of one element each
+                missing_list = heapq.nsmallest(20, missing_keywords)
+                st.markdown("  \n".join(f"• {keyword}" for keyword in missing_list))
                 
-                if len(missing_list) > 20:
-                    st.info(f"... and {len(missing_list) - 20} more")
+                if len(missing_keywords) > 20:
+                    st.info(f"... and {len(missing_keywords) - 20} more")
 
 # Footer
 st.markdown("---")
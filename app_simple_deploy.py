@@ -1,9 +1,14 @@
 import streamlit as st
-import pandas as pd
+import hashlib
 import re
-import os
-from datetime import datetime
-import time
+
+from utils.document_formats import extract_docx_text
+from utils.spacy_support import SPACY_EXCLUDED_COMPONENTS
+
+# Common words dropped by the fallback keyword extractor
+STOP_WORDS = frozenset({'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'must', 'can'})
+# Words of three or more letters; the length filter runs inside the regex engine
+KEYWORD_PATTERN = re.compile(r'\b[a-z]{3,}\b')
 
 # Simple text processing without heavy dependencies for fallback
 def simple_text_processing(text):
@@ -11,17 +16,10 @@ def simple_text_processing(text):
     if not text:
         return []
     
-    # Basic keyword extraction using regex
-    text = text.lower()
-    # Remove common words
-    stop_words = {'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'must', 'can'}
-    
-    # Extract words that look like skills/keywords
-    words = re.findall(r'\b[a-zA-Z]+\b', text)
-    keywords = [word for word in words if len(word) > 2 and word not in stop_words]
-    
-    # Return unique keywords
-    return list(set(keywords))
+    # Dedupe first so stop words are removed once per distinct word
+    keywords = set(KEYWORD_PATTERN.findall(text.lower()))
+    keywords -= STOP_WORDS
+    return list(keywords)
 
 # Lazy loading function
 @st.cache_resource
@@ -30,7 +28,8 @@ def load_dependencies():
     try:
         import spacy
         try:
-            nlp = spacy.load("en_core_web_sm", disable=["parser", "ner"])
+            # Only token attributes are read, so skip every trained component
+            nlp = spacy.load("en_core_web_sm", exclude=SPACY_EXCLUDED_COMPONENTS)
             return spacy, nlp, True
         except OSError:
             # Model not found, try to use blank model
@@ -49,51 +48,38 @@ def load_file_processors():
     except ImportError:
         processors['pdf'] = None
     
-    try:
-        from docx import Document
-        processors['docx'] = Document
-    except ImportError:
-        processors['docx'] = None
-    
     return processors
 
+# Failures raise instead of returning "" so they are never cached;
+# extract_text_from_file reports them
+@st.cache_data(show_spinner=False)
+def extract_text_cached(file_hash, file_type, _file_bytes):
+    """Extract text from file bytes, cached by content hash"""
+    processors = load_file_processors()
+    
+    if file_type == "application/pdf":
+        if not processors['pdf']:
+            raise RuntimeError("PDF processing not available. Please upload a TXT file.")
+        # Use PyMuPDF if available
+        with processors['pdf'].open(stream=_file_bytes, filetype="pdf") as pdf_document:
+            return "".join(page.get_text() for page in pdf_document)
+            
+    elif file_type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
+        # Read straight from the document XML, so python-docx isn't needed
+        return extract_docx_text(_file_bytes)
+            
+    elif file_type == "text/plain":
+        # Text files are always supported
+        return str(_file_bytes, "utf-8")
+    else:
+        raise ValueError("Unsupported file type. Please upload PDF, DOCX, or TXT.")
+
 def extract_text_from_file(uploaded_file):
     """Extract text from uploaded file with fallback options"""
+    # Key the cache on a short digest so Streamlit doesn't rehash the whole file
+    file_hash = hashlib.blake2b(uploaded_file.getbuffer(), digest_size=16).hexdigest()
     try:
-        processors = load_file_processors()
-        
-        if uploaded_file.type == "application/pdf":
-            if processors['pdf']:
-                # Use PyMuPDF if available
-                pdf_document = processors['pdf'].open(stream=uploaded_file.read(), filetype="pdf")
-                text = ""
-                for page in pdf_document:
-                    text += page.get_text()
-                pdf_document.close()
-                return text
-            else:
-                st.error("PDF processing not available. Please upload a TXT file.")
-                return ""
-                
-        elif uploaded_file.type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-            if processors['docx']:
-                # Use python-docx if available
-                doc = processors['docx'](uploaded_file)
-                text = ""
-                for paragraph in doc.paragraphs:
-                    text += paragraph.text + "\n"
-                return text
-            else:
-                st.error("DOCX processing not available. Please upload a TXT file.")
-                return ""
-                
-        elif uploaded_file.type == "text/plain":
-            # Text files are always supported
-            return str(uploaded_file.read(), "utf-8")
-        else:
-            st.error("Unsupported file type. Please upload PDF, DOCX, or TXT.")
-            return ""
-            
+        return extract_text_cached(file_hash, uploaded_file.type, uploaded_file.getvalue())
     except Exception as e:
         st.error(f"Error reading file: {str(e)}")
         return ""
@@ -112,7 +98,7 @@ def extract_keywords(text):
                     len(token.text) > 2 and 
                     not token.is_stop and 
                     not token.is_punct):
-                    keywords.append(token.lemma_)
+                    keywords.append(token.text)
             return list(set(keywords))
         except Exception:
             # Fall back to simple processing
@@ -0,0 +1,143 @@
+"""
+Career-level guidance data for the student/fresher features.
+
+Kept out of app.py so the lookup tables are built once per process instead of
+on every Streamlit rerun.
+"""
+from functools import cache, lru_cache
+
+# Priority skills for different career levels
+PRIORITY_SKILLS = {
+    'Student/Fresher': frozenset({'python', 'javascript', 'sql', 'git', 'html', 'css', 'communication', 'teamwork'}),
+    'Entry Level (0-2 years)': frozenset({'python', 'javascript', 'sql', 'git', 'agile', 'testing', 'debugging'}),
+    'Mid Level (2-5 years)': frozenset({'architecture', 'leadership', 'mentoring', 'system design', 'performance'}),
+    'Senior Level (5+ years)': frozenset({'strategy', 'leadership', 'architecture', 'mentoring', 'business'}),
+}
+
+PROJECT_SUGGESTIONS = {
+    'python': "Build a web scraper to collect job postings from different websites",
+    'javascript': "Create an interactive resume website with animations and dynamic content",
+    'react': "Develop a job application tracker with React and local storage",
+    'sql': "Design a database for a university course management system",
+    'machine learning': "Build a resume keyword optimizer using NLP techniques",
+    'data science': "Analyze job market trends using public datasets",
+    'web development': "Create a portfolio website showcasing all your projects",
+    'git': "Contribute to open-source projects on GitHub",
+    'api': "Build a REST API for a simple task management application",
+    'testing': "Add comprehensive tests to your existing projects",
+    'docker': "Containerize your web applications for easy deployment",
+    'cloud': "Deploy your projects on AWS, Google Cloud, or Azure",
+}
+
+# Markdown line for each suggestion, formatted once at import
+PROJECT_SUGGESTION_LINES = {
+    skill: f"**{skill.title()}**: {project}" for skill, project in PROJECT_SUGGESTIONS.items()
+}
+
+
+# Reruns pass the same frozenset from the session's analysis cache, so
+# toggling display options never recomputes the gap breakdown
+@lru_cache(maxsize=16)
+def analyze_skill_gaps(missing_skills, career_level):
+    """Analyze skill gaps based on career level, given the already-computed missing keywords"""
+    relevant_priority = PRIORITY_SKILLS.get(career_level, frozenset())
+    critical_gaps = missing_skills.intersection(relevant_priority)
+
+    return {
+        'all_gaps': missing_skills,
+        'critical_gaps': critical_gaps,
+        'priority_skills': relevant_priority
+    }
+
+
+@lru_cache(maxsize=16)
+def suggest_projects_for_skills(missing_skills):
+    """Suggest projects based on missing skills"""
+    suggestions = []
+    # Walk the 12 known projects rather than every missing keyword
+    for skill, line in PROJECT_SUGGESTION_LINES.items():
+        if skill in missing_skills:
+            suggestions.append(line)
+            if len(suggestions) == 5:  # Return top 5 suggestions
+                break
+
+    return tuple(suggestions)
+
+
+@cache
+def get_learning_resources():
+    """Get learning resources for different skills"""
+    return {
+        'python': {
+            'courses': ['Python for Everybody (Coursera)', 'Complete Python Bootcamp (Udemy)', 'CS50 Python (Harvard)'],
+            'certifications': ['Python Institute PCAP', 'Microsoft Python Certification'],
+            'projects': ['Web scraper', 'Data analysis dashboard', 'Simple web app with Flask']
+        },
+        'javascript': {
+            'courses': ['JavaScript Fundamentals (freeCodeCamp)', 'Modern JavaScript (Udemy)', 'JavaScript30 (Wes Bos)'],
+            'certifications': ['freeCodeCamp JavaScript Certification'],
+            'projects': ['Interactive website', 'To-do app', 'Weather app with API']
+        },
+        'java': {
+            'courses': ['Java Programming (Coursera)', 'Complete Java Masterclass (Udemy)', 'Oracle Java Tutorials'],
+            'certifications': ['Oracle Certified Associate (OCA)', 'Oracle Certified Professional (OCP)'],
+            'projects': ['Banking system', 'Library management system', 'Simple game development']
+        },
+        'react': {
+            'courses': ['React Complete Guide (Udemy)', 'React Documentation', 'freeCodeCamp React'],
+            'certifications': ['freeCodeCamp Front End Libraries'],
+            'projects': ['Portfolio website', 'E-commerce frontend', 'Social media dashboard']
+        },
+        'sql': {
+            'courses': ['SQL for Data Science (Coursera)', 'Complete SQL Bootcamp (Udemy)', 'W3Schools SQL'],
+            'certifications': ['Microsoft SQL Server Certification', 'Oracle Database Certification'],
+            'projects': ['Database design for e-commerce', 'Data analysis queries', 'School management system']
+        },
+        'machine learning': {
+            'courses': ['ML Course by Andrew Ng (Coursera)', 'Hands-On ML (Kaggle Learn)', 'Fast.ai Practical Deep Learning'],
+            'certifications': ['Google ML Certification', 'AWS ML Specialty'],
+            'projects': ['Prediction model', 'Image classification', 'Recommendation system']
+        },
+        'data science': {
+            'courses': ['Data Science Specialization (Coursera)', 'Python for Data Science (edX)', 'Kaggle Learn'],
+            'certifications': ['Google Data Analytics Certificate', 'IBM Data Science Certificate'],
+            'projects': ['Sales analysis dashboard', 'Customer segmentation', 'Predictive analytics']
+        },
+        'web development': {
+            'courses': ['The Odin Project', 'freeCodeCamp Full Stack', 'Web Developer Bootcamp (Udemy)'],
+            'certifications': ['freeCodeCamp Responsive Web Design', 'Google UX Design Certificate'],
+            'projects': ['Personal portfolio', 'Restaurant website', 'Blog platform']
+        }
+    }
+
+
+@cache
+def get_entry_level_tips():
+    """Get tips for entry-level job seekers"""
+    return [
+        "🎯 **Tailor your resume** for each job application - highlight relevant coursework and projects",
+        "🔗 **Build a strong LinkedIn profile** with a professional photo and detailed experience section",
+        "📁 **Create a GitHub portfolio** showcasing your best projects with clear README files",
+        "🤝 **Network actively** - attend virtual meetups, join professional groups, connect with alumni",
+        "📝 **Apply to entry-level positions** even if you don't meet 100% of requirements",
+        "🎤 **Practice common interview questions** and prepare STAR method answers",
+        "📚 **Show enthusiasm for learning** - mention online courses, bootcamps, or self-study",
+        "🏆 **Highlight transferable skills** from internships, part-time jobs, or volunteer work",
+        "💼 **Consider internships and apprenticeships** as stepping stones to full-time roles",
+        "📧 **Follow up professionally** after applications and interviews"
+    ]
+
+
+@cache
+def get_entry_level_tip_columns():
+    """Split the entry-level tips into left and right column halves once"""
+    tips = get_entry_level_tips()
+    midpoint = (len(tips) + 1) // 2
+    return tuple(tips[:midpoint]), tuple(tips[midpoint:])
+
+
+@lru_cache(maxsize=16)
+def skills_with_learning_resources(missing_skills, limit=3):
+    """Missing skills that have curated learning resources, in resource order"""
+    # Walk the handful of curated skills rather than every missing keyword
+    return tuple(skill for skill in get_learning_resources() if skill in missing_skills)[:limit]
@@ -0,0 +1,54 @@
+"""
+File-format details shared by the text extractors in the app scripts.
+"""
+import io
+import zipfile
+from xml.etree import ElementTree
+
+# DOCX text lives in <w:t> runs grouped into <w:p> paragraphs of word/document.xml
+WORD_NAMESPACE = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+WORD_PARAGRAPH_TAG = WORD_NAMESPACE + "p"
+WORD_RUN_TAG = WORD_NAMESPACE + "r"
+WORD_TEXT_TAG = WORD_NAMESPACE + "t"
+# Run content that python-docx's paragraph.text renders as whitespace; without
+# it "Skills:<tab>Python<br>Docker" would read as one word
+WORD_WHITESPACE_TAGS = {
+    WORD_NAMESPACE + "tab": "\t",
+    WORD_NAMESPACE + "br": "\n",
+    WORD_NAMESPACE + "cr": "\n",
+}
+
+
+def extract_docx_text(file_bytes):
+    """Extract DOCX text as one line per paragraph, keeping tabs and line breaks"""
+    paragraphs, open_paragraphs = [], []
+    run_depth = 0
+    with zipfile.ZipFile(io.BytesIO(file_bytes)) as archive, archive.open("word/document.xml") as xml_file:
+        # Stream the XML and drop each paragraph once read to keep memory flat.
+        # Text boxes nest whole paragraphs inside a run, so every open <w:p>
+        # collects its own pieces instead of prefixing them to the inner one.
+        for event, element in ElementTree.iterparse(xml_file, events=("start", "end")):
+            tag = element.tag
+            if tag == WORD_PARAGRAPH_TAG:
+                if event == "start":
+                    open_paragraphs.append([])
+                else:
+                    paragraphs.append("".join(open_paragraphs.pop()))
+                    element.clear()
+            elif tag == WORD_RUN_TAG:
+                run_depth += 1 if event == "start" else -1
+            elif event == "end" and run_depth and open_paragraphs:
+                # Only run content counts; <w:tab> also defines tab stops in <w:pPr>
+                if tag == WORD_TEXT_TAG:
+                    if element.text:
+                        open_paragraphs[-1].append(element.text)
+                elif tag in WORD_WHITESPACE_TAGS:
+                    open_paragraphs[-1].append(WORD_WHITESPACE_TAGS[tag])
+    return "\n".join(paragraphs)
+
+
+def release_mupdf_store(fitz):
+    """Empty MuPDF's global resource store after a document has been read"""
+    # The store keeps fonts and images from every document opened in the
+    # process, so in a long-lived server it only grows; callers cache the text
+    fitz.TOOLS.store_shrink(100)
@@ -0,0 +1,27 @@
+"""
+spaCy helpers shared by the app scripts.
+
+Importing this module does not import spaCy. It lives outside the scripts so
+that state kept here (the preload thread) survives Streamlit reruns.
+"""
+import threading
+
+# Every trained component of en_core_web_sm, including senter, which ships
+# disabled but is still deserialized. Excluded (not just disabled) so none are
+# loaded; the tokenizer alone sets the is_stop / is_alpha / like_num flags the
+# keyword filters read.
+SPACY_EXCLUDED_COMPONENTS = ("tok2vec", "tagger", "parser", "senter", "attribute_ruler", "lemmatizer", "ner")
+
+_preload_lock = threading.Lock()
+_preload_thread = None
+
+
+def start_model_preload(loader):
+    """Run loader on a daemon thread, at most once per process"""
+    # The thread has no ScriptRunContext, so loader must not call st.* UI functions
+    global _preload_thread
+    with _preload_lock:
+        if _preload_thread is None:
+            _preload_thread = threading.Thread(target=loader, name="spacy-preload", daemon=True)
+            _preload_thread.start()
+    return _preload_thread
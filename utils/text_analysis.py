@@ -1,2 +1,119 @@
+"""
+Lightweight text processing helpers for the AI Resume Grader.
 
-# Placeholder for future helper functions
+These live outside app.py because Streamlit re-executes the main script on
+every rerun; module-level constants and caches defined here are built once
+per process and survive reruns.
+"""
+import re
+import sys
+from collections import Counter
+from functools import lru_cache
+
+# scikit-learn's ENGLISH_STOP_WORDS (minus "system", a common skill keyword)
+# merged with the original fallback list. Inlined to avoid importing sklearn.
+BASIC_STOPWORDS = frozenset({
+    'a', 'about', 'above', 'across', 'after', 'afterwards', 'again', 'against',
+    'all', 'almost', 'alone', 'along', 'already', 'also', 'although', 'always',
+    'am', 'among', 'amongst', 'amoungst', 'amount', 'an', 'and', 'another',
+    'any', 'anyhow', 'anyone', 'anything', 'anyway', 'anywhere', 'are',
+    'around', 'as', 'at', 'back', 'be', 'became', 'because', 'become',
+    'becomes', 'becoming', 'been', 'before', 'beforehand', 'behind', 'being',
+    'below', 'beside', 'besides', 'between', 'beyond', 'bill', 'both',
+    'bottom', 'boy', 'but', 'by', 'call', 'can', 'cannot', 'cant', 'co', 'con',
+    'could', 'couldnt', 'cry', 'day', 'de', 'describe', 'detail', 'did', 'do',
+    'done', 'down', 'due', 'during', 'each', 'eg', 'eight', 'either', 'eleven',
+    'else', 'elsewhere', 'empty', 'enough', 'etc', 'even', 'ever', 'every',
+    'everyone', 'everything', 'everywhere', 'except', 'few', 'fifteen',
+    'fifty', 'fill', 'find', 'fire', 'first', 'five', 'for', 'former',
+    'formerly', 'forty', 'found', 'four', 'from', 'front', 'full', 'further',
+    'get', 'give', 'go', 'had', 'has', 'hasnt', 'have', 'he', 'hence', 'her',
+    'here', 'hereafter', 'hereby', 'herein', 'hereupon', 'hers', 'herself',
+    'him', 'himself', 'his', 'how', 'however', 'hundred', 'i', 'ie', 'if', 'in',
+    'inc', 'indeed', 'interest', 'into', 'is', 'it', 'its', 'itself', 'keep',
+    'last', 'latter', 'latterly', 'least', 'less', 'let', 'ltd', 'made', 'man',
+    'many', 'may', 'me', 'meanwhile', 'might', 'mill', 'mine', 'more',
+    'moreover', 'most', 'mostly', 'move', 'much', 'must', 'my', 'myself',
+    'name', 'namely', 'neither', 'never', 'nevertheless', 'new', 'next', 'nine',
+    'no', 'nobody', 'none', 'noone', 'nor', 'not', 'nothing', 'now', 'nowhere',
+    'of', 'off', 'often', 'old', 'on', 'once', 'one', 'only', 'onto', 'or',
+    'other', 'others', 'otherwise', 'our', 'ours', 'ourselves', 'out', 'over',
+    'own', 'part', 'per', 'perhaps', 'please', 'put', 'rather', 're', 'same',
+    'say', 'see', 'seem', 'seemed', 'seeming', 'seems', 'serious', 'several',
+    'she', 'should', 'show', 'side', 'since', 'sincere', 'six', 'sixty', 'so',
+    'some', 'somehow', 'someone', 'something', 'sometime', 'sometimes',
+    'somewhere', 'still', 'such', 'take', 'ten', 'than', 'that', 'the',
+    'their', 'them', 'themselves', 'then', 'thence', 'there', 'thereafter',
+    'thereby', 'therefore', 'therein', 'thereupon', 'these', 'they', 'thick',
+    'thin', 'third', 'this', 'those', 'though', 'three', 'through',
+    'throughout', 'thru', 'thus', 'to', 'together', 'too', 'top', 'toward',
+    'towards', 'twelve', 'twenty', 'two', 'un', 'under', 'until', 'up', 'upon',
+    'us', 'use', 'very', 'via', 'was', 'we', 'well', 'were', 'what',
+    'whatever', 'when', 'whence', 'whenever', 'where', 'whereafter', 'whereas',
+    'whereby', 'wherein', 'whereupon', 'wherever', 'whether', 'which', 'while',
+    'whither', 'who', 'whoever', 'whole', 'whom', 'whose', 'why', 'will',
+    'with', 'within', 'without', 'would', 'yet', 'you', 'your', 'yours',
+    'yourself', 'yourselves',
+})
+
+WORD_PATTERN = re.compile(r"[a-z]+")
+# Runs of a-z not touching other (accented) letters, so "café" isn't cut to "caf"
+ASCII_WORD_PATTERN = re.compile(r"(?<![^\W\d_])[a-z]+(?![^\W\d_])")
+
+# bytes.translate table that lowercases A-Z and maps every other non-letter
+# to a space, so ASCII text is normalized and tokenized in one C pass
+ASCII_LETTERS_ONLY = bytes(
+    c if 0x61 <= c <= 0x7a else c + 0x20 if 0x41 <= c <= 0x5a else 0x20
+    for c in range(256)
+)
+
+
+# Process-local memo: returns the same immutable frozenset without the pickle
+# round-trip st.cache_data would add, and survives reruns like the rest of
+# this module
+@lru_cache(maxsize=32)
+def extract_keywords_regex(text, min_length=3):
+    """Extract keywords from runs of a-z letters, without loading spaCy"""
+    # str.isascii() reads a cached flag, so this check doesn't scan the text
+    if text.isascii():
+        unique = set(text.encode("ascii").translate(ASCII_LETTERS_ONLY).split())
+        words = {word.decode("ascii") for word in unique if len(word) >= min_length}
+    else:
+        lowered = text.lower()
+        words = {word for word in ASCII_WORD_PATTERN.findall(lowered) if len(word) >= min_length}
+    return frozenset(map(sys.intern, words - BASIC_STOPWORDS))
+
+
+def compare_keywords(resume_keywords, jd_keywords):
+    """Split job keywords into (matched, missing) relative to the resume"""
+    # isdisjoint stops at the first shared keyword and allocates nothing
+    if resume_keywords.isdisjoint(jd_keywords):
+        return frozenset(), jd_keywords
+    # The C set intersection already iterates the smaller operand
+    matched = resume_keywords & jd_keywords
+    if len(matched) == len(jd_keywords):
+        return matched, frozenset()
+    return matched, jd_keywords - matched
+
+
+@lru_cache(maxsize=8)
+def lowercase_words(text):
+    """Lowercased a-z word runs of text, kept so a new keyword set doesn't re-tokenize"""
+    return tuple(WORD_PATTERN.findall(text.lower()))
+
+
+# Keyword sets are frozensets, so they can be part of the memo key; reruns
+# pass the same text and keyword objects and hit on identity
+@lru_cache(maxsize=16)
+def top_keyword_frequencies(text, keywords, limit=10):
+    """Count how often each keyword appears in text, most frequent first"""
+    words = lowercase_words(text)
+    # filter() with the bound __contains__ keeps the membership test in C
+    return tuple(Counter(filter(keywords.__contains__, words)).most_common(limit))
+
+
+def calculate_match_score(matched_keywords, jd_keywords):
+    """Percentage of job keywords found in the resume, rounded to 2 places"""
+    if not jd_keywords:
+        return 0.0
+    return round(len(matched_keywords) / len(jd_keywords) * 100, 2)